@@ -0,0 +1,20 @@
+"""Command-line entry point: ``python -m app``."""
+
+from __future__ import annotations
+
+import uvicorn
+
+from .core.config import get_settings
+from .core.event_loop import configure_event_loop
+
+
+def main() -> None:
+    """Serve the application with the event loop selected by ``APP_EVENT_LOOP``."""
+
+    settings = get_settings()
+    loop = configure_event_loop(settings.event_loop)
+    uvicorn.run("app.main:app", loop=loop)
+
+
+if __name__ == "__main__":
+    main()
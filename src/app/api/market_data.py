@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 
 from ..services.data_feed import DataFeedService
 
@@ -10,24 +11,30 @@ router = APIRouter(prefix="/market-data", tags=["market-data"])
 
 
 def get_data_feed_service(request: Request) -> DataFeedService:
+    """Return the running data feed service from application state or raise 503."""
+
     service = getattr(request.app.state, "data_feed_service", None)
     if service is None:
         raise HTTPException(status_code=503, detail="Market data feed is not available")
+    if not service.ready:
+        raise HTTPException(status_code=503, detail="Market data feed is starting")
     return service
 
 
-@router.get("/{symbol}")
+@router.get("/{symbol}", response_class=ORJSONResponse)
 async def market_data_snapshot(
     symbol: str,
+    request: Request,
     max_ticks: int | None = Query(None, ge=1, le=1000),
-    service: DataFeedService = Depends(get_data_feed_service),
-) -> dict[str, object]:
+) -> ORJSONResponse:
     """Return the current market data snapshot for the requested symbol."""
 
-    if symbol.upper() != service.symbol:
+    service = get_data_feed_service(request)
+    tracked_symbol = service.symbol
+    if symbol != tracked_symbol and symbol.upper() != tracked_symbol:
         raise HTTPException(status_code=404, detail="Symbol not tracked")
 
-    return service.snapshot(max_ticks=max_ticks)
+    return ORJSONResponse(service.snapshot(max_ticks=max_ticks))
 
 
 __all__ = ["router"]
@@ -2,20 +2,16 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Request
 
-from ..core.config import Settings, get_settings
-from ..utils.time import convert_eastern_to_utc_minus_three, current_eastern_time
+from ..core.config import SettingsSnapshot
+from ..utils.time import UTC_MINUS_THREE, current_eastern_time
 
 router = APIRouter()
 
 
-@router.get("/health", tags=["health"])
-async def healthcheck(settings: Settings = Depends(get_settings)) -> dict[str, object]:
-    """Simple health endpoint with timestamp metadata."""
-
-    eastern_now = current_eastern_time()
-    target_now = convert_eastern_to_utc_minus_three(eastern_now)
+def build_health_template(settings: SettingsSnapshot) -> dict[str, object]:
+    """Return the static portion of the health payload, computed once at startup."""
 
     return {
         "status": "ok",
@@ -23,6 +19,17 @@ async def healthcheck(settings: Settings = Depends(get_settings)) -> dict[str, o
         "version": settings.app_version,
         "environment": settings.environment,
         "timezone": settings.default_timezone,
-        "timestamp_eastern": eastern_now.isoformat(),
-        "timestamp_utc_minus_three": target_now.isoformat(),
     }
+
+
+@router.get("/health", tags=["health"])
+async def healthcheck(request: Request) -> dict[str, object]:
+    """Simple health endpoint with timestamp metadata."""
+
+    eastern_now = current_eastern_time()
+    target_now = eastern_now.astimezone(UTC_MINUS_THREE)
+
+    payload = request.app.state.health_template.copy()
+    payload["timestamp_eastern"] = eastern_now.isoformat()
+    payload["timestamp_utc_minus_three"] = target_now.isoformat()
+    return payload
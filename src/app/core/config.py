@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
@@ -9,6 +10,8 @@ from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .event_loop import EventLoopName
+
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 ENV_FILE = BASE_DIR / ".env"
 
@@ -37,6 +40,7 @@ class Settings(BaseSettings):
 
     default_timezone: str = Field(default="America/New_York", alias="APP_TIMEZONE")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    event_loop: EventLoopName = Field(default="uvloop", alias="APP_EVENT_LOOP")
 
     service_api_key: str | None = Field(default=None, alias="SERVICE_API_KEY")
     scheduler_interval_seconds: int = Field(
@@ -57,8 +61,38 @@ class Settings(BaseSettings):
     )
 
 
+@dataclass(slots=True, frozen=True)
+class SettingsSnapshot:
+    """Immutable, validated view of :class:`Settings` used on hot paths."""
+
+    environment: str
+    debug: bool
+    app_name: str
+    app_version: str
+    default_timezone: str
+    log_level: str
+    event_loop: EventLoopName
+    service_api_key: str | None
+    scheduler_interval_seconds: int
+    market_data_enabled: bool
+    market_data_provider: str
+    market_data_symbol: str
+    market_data_timezone: str
+    market_data_history_limit: int
+    market_data_tick_buffer_size: int
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> SettingsSnapshot:
+        """Freeze a validated settings model into a snapshot."""
+
+        return cls(**settings.model_dump())
+
+
 @lru_cache
-def get_settings() -> Settings:
-    """Return a cached settings instance."""
+def get_settings() -> SettingsSnapshot:
+    """Return a cached settings snapshot.
+
+    Pydantic validates the environment once; callers then read plain slotted attributes.
+    """
 
-    return Settings()
+    return SettingsSnapshot.from_settings(Settings())
@@ -0,0 +1,44 @@
+"""Event loop policy configuration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+from typing import Literal, get_args
+
+logger = logging.getLogger(__name__)
+
+EventLoopName = Literal["asyncio", "uvloop"]
+SUPPORTED_EVENT_LOOPS: tuple[EventLoopName, ...] = get_args(EventLoopName)
+
+
+def configure_event_loop(name: str = "uvloop") -> str:
+    """Install the requested event loop policy and return the name of the active loop.
+
+    Falls back to the default asyncio loop when uvloop is unavailable (e.g. on Windows).
+    """
+
+    normalized = name.strip().lower()
+    if normalized not in SUPPORTED_EVENT_LOOPS:
+        msg = f"Unsupported event loop '{name}'"
+        raise ValueError(msg)
+
+    if normalized == "asyncio":
+        return normalized
+
+    if sys.platform == "win32":
+        logger.debug("uvloop is not supported on Windows; using the default asyncio loop")
+        return "asyncio"
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop is not installed; using the default asyncio loop")
+        return "asyncio"
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return normalized
+
+
+__all__ = ["SUPPORTED_EVENT_LOOPS", "EventLoopName", "configure_event_loop"]
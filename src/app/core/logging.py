@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 from logging.config import dictConfig
 from typing import Any
@@ -47,13 +46,17 @@ LOGGING_CONFIG: dict[str, Any] = {
 def configure_logging(level: str | int = "INFO") -> None:
     """Configure the logging subsystem for the application."""
 
-    config = copy.deepcopy(LOGGING_CONFIG)
-    config["root"]["level"] = level
+    loggers = dict(LOGGING_CONFIG["loggers"])
 
     # Ensure the FastAPI/uvicorn related loggers follow the requested level as well.
     for logger_name in ("uvicorn", "uvicorn.error", "app"):
-        config["loggers"].setdefault(logger_name, {"handlers": ["default"], "propagate": False})
-        config["loggers"][logger_name]["level"] = level
-
+        base = loggers.get(logger_name, {"handlers": ["default"], "propagate": False})
+        loggers[logger_name] = {**base, "level": level}
+
+    config = {
+        **LOGGING_CONFIG,
+        "loggers": loggers,
+        "root": {**LOGGING_CONFIG["root"], "level": level},
+    }
     dictConfig(config)
     logging.getLogger(__name__).debug("Logging configured with level %s", level)
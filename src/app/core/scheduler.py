@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import logging
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,20 @@ logger = logging.getLogger(__name__)
 Callback = Callable[[], Any | Awaitable[Any]]
 
 
+@dataclass(slots=True, frozen=True)
+class _ScheduledCallback:
+    """A registered callback along with how it should be invoked."""
+
+    callback: Callback
+    is_coroutine: bool
+    blocking: bool = False
+
+
+def _release(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class AppScheduler:
     """A minimal background scheduler intended to be extended with real jobs."""
 
@@ -20,12 +35,21 @@ class AppScheduler:
         self.interval_seconds = interval_seconds
         self._shutdown_event = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
-        self._callbacks: list[Callback] = []
+        self._waiter: asyncio.Future[None] | None = None
+        self._callbacks: tuple[_ScheduledCallback, ...] = ()
+
+    def register(self, callback: Callback, *, blocking: bool = False) -> None:
+        """Register a callback to execute on each heartbeat.
 
-    def register(self, callback: Callback) -> None:
-        """Register a callback to execute on each heartbeat."""
+        Synchronous callbacks run inline on the event loop unless ``blocking`` is set, in which
+        case they are dispatched to a worker thread so slow I/O does not stall the loop.
+        """
 
-        self._callbacks.append(callback)
+        is_coroutine = inspect.iscoroutinefunction(callback)
+        if blocking and is_coroutine:
+            msg = "Coroutine callbacks cannot be registered as blocking"
+            raise ValueError(msg)
+        self._callbacks = (*self._callbacks, _ScheduledCallback(callback, is_coroutine, blocking))
         logger.debug("Registered scheduler callback %s", callback)
 
     async def start(self) -> None:
@@ -46,6 +70,8 @@ class AppScheduler:
             return
 
         self._shutdown_event.set()
+        if self._waiter is not None:
+            _release(self._waiter)
         await asyncio.gather(self._task, return_exceptions=True)
         self._task = None
         logger.info("Scheduler stopped")
@@ -53,14 +79,20 @@ class AppScheduler:
     async def _runner(self) -> None:
         """Execute registered callbacks on the configured cadence."""
 
-        while True:
+        loop = asyncio.get_running_loop()
+        while not self._shutdown_event.is_set():
+            waiter: asyncio.Future[None] = loop.create_future()
+            handle = loop.call_later(float(self.interval_seconds), _release, waiter)
+            self._waiter = waiter
             try:
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(), timeout=float(self.interval_seconds)
-                )
+                await waiter
+            finally:
+                handle.cancel()
+                self._waiter = None
+
+            if self._shutdown_event.is_set():
                 break
-            except asyncio.TimeoutError:
-                await self._execute_callbacks()
+            await self._execute_callbacks()
         logger.debug("Scheduler runner exiting")
 
     async def _execute_callbacks(self) -> None:
@@ -70,10 +102,17 @@ class AppScheduler:
             logger.debug("Scheduler heartbeat (no callbacks registered)")
             return
 
-        for callback in list(self._callbacks):
+        for entry in self._callbacks:
             try:
-                result = callback()
-                if inspect.isawaitable(result):
+                if entry.is_coroutine:
+                    await entry.callback()
+                    continue
+                if entry.blocking:
+                    await asyncio.to_thread(entry.callback)
+                    continue
+                result = entry.callback()
+                # Callables that are not coroutine functions may still return awaitables.
+                if result is not None and inspect.isawaitable(result):
                     await result
             except Exception:  # noqa: BLE001 - bubbling up would stop the loop
-                logger.exception("Scheduler callback %s raised an exception", callback)
+                logger.exception("Scheduler callback %s raised an exception", entry.callback)
@@ -1,12 +1,14 @@
 """FastAPI application bootstrap."""
 
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 import logging
 
 from fastapi import FastAPI
 
 from .api import api_router
+from .api.routes import build_health_template
 from .core.config import get_settings
 from .core.logging import configure_logging
 from .core.scheduler import AppScheduler
@@ -24,39 +26,63 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
     configure_logging(settings.log_level)
 
+    loop = asyncio.get_running_loop()
+    previous_task_factory = loop.get_task_factory()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     scheduler = AppScheduler(interval_seconds=settings.scheduler_interval_seconds)
     scheduler.register(log_heartbeat)
     await scheduler.start()
 
     data_feed_service: DataFeedService | None = None
     if settings.market_data_enabled:
-        candidate_service: DataFeedService | None = None
         try:
-            candidate_service = DataFeedService.from_settings(
+            data_feed_service = DataFeedService.from_settings(
                 settings.market_data_provider,
                 symbol=settings.market_data_symbol,
                 history_limit=settings.market_data_history_limit,
                 tick_buffer_size=settings.market_data_tick_buffer_size,
                 timezone_name=settings.market_data_timezone,
             )
-            await candidate_service.start()
         except Exception:  # noqa: BLE001 - log error and continue startup
-            logger.exception("Failed to start market data feed service")
-            if candidate_service is not None:
-                await candidate_service.stop()
-        else:
-            data_feed_service = candidate_service
+            logger.exception("Failed to create market data feed service")
 
     app.state.settings = settings
+    app.state.health_template = build_health_template(settings)
     app.state.scheduler = scheduler
     app.state.data_feed_service = data_feed_service
 
+    data_feed_startup: asyncio.Task[None] | None = None
+    if data_feed_service is not None:
+        data_feed_startup = asyncio.create_task(
+            _start_data_feed(app, data_feed_service), name="data-feed-startup"
+        )
+
     try:
         yield
     finally:
-        if data_feed_service is not None:
-            await data_feed_service.stop()
+        if data_feed_startup is not None and not data_feed_startup.done():
+            data_feed_startup.cancel()
+            with suppress(asyncio.CancelledError):
+                await data_feed_startup
+        if app.state.data_feed_service is not None:
+            await app.state.data_feed_service.stop()
         await scheduler.shutdown()
+        loop.set_task_factory(previous_task_factory)
+
+
+async def _start_data_feed(app: FastAPI, service: DataFeedService) -> None:
+    """Start the market data feed, withdrawing it from app state if startup fails."""
+
+    try:
+        await service.start()
+    except asyncio.CancelledError:
+        raise
+    except Exception:  # noqa: BLE001 - log error and keep serving without market data
+        logger.exception("Failed to start market data feed service")
+        app.state.data_feed_service = None
+        await service.stop()
 
 
 def create_app() -> FastAPI:
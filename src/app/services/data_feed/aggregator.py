@@ -2,23 +2,18 @@
 
 from __future__ import annotations
 
+import sys
 from collections import deque
 from dataclasses import replace
-from datetime import datetime, timedelta
+from datetime import datetime
+from itertools import pairwise
+from operator import attrgetter
 from typing import Deque, Iterable
 from zoneinfo import ZoneInfo
 
 from .types import ARGENTINA_TIMEZONE, OhlcvCandle, Timeframe, TradeTick
 
-
-def _floor_timestamp(dt: datetime, delta: timedelta, tz: ZoneInfo) -> datetime:
-    """Floor the datetime to the start of the timeframe within the provided timezone."""
-
-    localized = dt.astimezone(tz)
-    seconds = int(delta.total_seconds())
-    timestamp = int(localized.timestamp())
-    floored = timestamp - (timestamp % seconds)
-    return datetime.fromtimestamp(floored, tz=tz)
+_open_time = attrgetter("open_time")
 
 
 class OhlcvAggregator:
@@ -31,11 +26,20 @@ class OhlcvAggregator:
         max_length: int = 500,
         timezone_: ZoneInfo = ARGENTINA_TIMEZONE,
     ) -> None:
-        self._symbol = symbol.upper()
+        self._symbol = sys.intern(symbol.upper())
         self._timezone = timezone_
         self._buffers: dict[Timeframe, Deque[OhlcvCandle]] = {
             timeframe: deque(maxlen=max_length) for timeframe in timeframes
         }
+        # Each buffer paired with its frame length in seconds.
+        self._frames: tuple[tuple[Timeframe, deque[OhlcvCandle], int], ...] = tuple(
+            (timeframe, buffer, int(timeframe.duration.total_seconds()))
+            for timeframe, buffer in self._buffers.items()
+        )
+        # Epoch second at which the newest candle of each buffer opens.
+        self._open_epochs: dict[Timeframe, int] = {}
+        # Timeframes whose newest candle was seeded and still carries the exchange close time.
+        self._seeded_tails: set[Timeframe] = set()
 
     @property
     def timezone(self) -> ZoneInfo:
@@ -48,17 +52,49 @@ class OhlcvAggregator:
 
         buffer = self._buffers[timeframe]
         buffer.clear()
-        for candle in sorted(candles, key=lambda c: c.open_time):
-            normalized = self._ensure_timezone(candle)
-            buffer.append(normalized)
+
+        normalized = [self._ensure_timezone(candle) for candle in candles]
+        if any(later.open_time < earlier.open_time for earlier, later in pairwise(normalized)):
+            normalized.sort(key=_open_time)
+        buffer.extend(normalized)
+
+        if buffer:
+            self._open_epochs[timeframe] = int(buffer[-1].open_time.timestamp())
+            self._seeded_tails.add(timeframe)
+        else:
+            self._open_epochs.pop(timeframe, None)
+            self._seeded_tails.discard(timeframe)
 
     def update(self, tick: TradeTick) -> None:
         """Update all timeframe buffers based on the provided trade tick."""
 
-        localized_tick = self._localize_tick(tick)
+        if tick.timestamp.tzinfo is None:
+            message = "Trade ticks must include timezone-aware timestamps"
+            raise ValueError(message)
+
+        epoch = int(tick.timestamp.timestamp())
+        price = tick.price
+        quantity = tick.quantity
+        open_epochs = self._open_epochs
+        seeded_tails = self._seeded_tails
+
+        for timeframe, buffer, frame_seconds in self._frames:
+            frame_epoch = epoch - epoch % frame_seconds
+            if open_epochs.get(timeframe) != frame_epoch:
+                self._open_candle(buffer, timeframe, frame_epoch, price, quantity)
+                continue
 
-        for timeframe, buffer in self._buffers.items():
-            self._upsert_candle(buffer, timeframe, localized_tick)
+            candle = buffer[-1]
+            if price > candle.high:
+                candle.high = price
+            elif price < candle.low:
+                candle.low = price
+            candle.close = price
+            candle.volume += quantity
+            candle.invalidate()
+            if timeframe in seeded_tails:
+                candle.close_time = candle.open_time + timeframe.duration
+                seeded_tails.discard(timeframe)
 
     def get_candles(self, timeframe: Timeframe) -> list[OhlcvCandle]:
         """Return the current candles for the requested timeframe."""
@@ -81,46 +117,30 @@ class OhlcvAggregator:
             close_time=candle.close_time.astimezone(self._timezone),
         )
 
-    def _localize_tick(self, tick: TradeTick) -> TradeTick:
-        if tick.timestamp.tzinfo is None:
-            message = "Trade ticks must include timezone-aware timestamps"
-            raise ValueError(message)
-
-        if tick.timestamp.tzinfo == self._timezone:
-            return tick
-
-        return replace(tick, timestamp=tick.timestamp.astimezone(self._timezone))
-
-    def _upsert_candle(
+    def _open_candle(
         self,
         buffer: Deque[OhlcvCandle],
         timeframe: Timeframe,
-        tick: TradeTick,
+        frame_epoch: int,
+        price: float,
+        quantity: float,
     ) -> None:
-        frame_start = _floor_timestamp(tick.timestamp, timeframe.duration, self._timezone)
+        frame_start = datetime.fromtimestamp(frame_epoch, tz=self._timezone)
         frame_end = frame_start + timeframe.duration
-
-        if buffer and buffer[-1].open_time == frame_start:
-            candle = buffer[-1]
-            candle.high = max(candle.high, tick.price)
-            candle.low = min(candle.low, tick.price)
-            candle.close = tick.price
-            candle.volume += tick.quantity
-            candle.close_time = frame_end
-            return
-
         new_candle = OhlcvCandle(
             symbol=self._symbol,
             timeframe=timeframe,
             open_time=frame_start,
             close_time=frame_end,
-            open=tick.price,
-            high=tick.price,
-            low=tick.price,
-            close=tick.price,
-            volume=tick.quantity,
+            open=price,
+            high=price,
+            low=price,
+            close=price,
+            volume=quantity,
         )
         buffer.append(new_candle)
+        self._open_epochs[timeframe] = frame_epoch
+        self._seeded_tails.discard(timeframe)
 
 
 __all__ = ["OhlcvAggregator"]
@@ -2,22 +2,26 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 from collections.abc import Iterable, Sequence
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
-
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from ...core.scheduler import AppScheduler
 from .aggregator import OhlcvAggregator
 from .types import ARGENTINA_TIMEZONE, OhlcvCandle, Timeframe, TradeTick
 
 logger = logging.getLogger(__name__)
 
+_candle_high = attrgetter("high")
+_candle_low = attrgetter("low")
+
 
 class MarketDataManager:
     """Manage OHLCV candles across multiple timeframes with caching and persistence."""
@@ -35,6 +39,7 @@ class MarketDataManager:
         resolved_timeframes = tuple(timeframes) if timeframes else Timeframe.default_sequence()
         self._symbol = symbol.upper()
         self._timeframes = resolved_timeframes
+        self._interval_keys: dict[Timeframe, str] = {tf: tf.interval for tf in resolved_timeframes}
         self._timezone = timezone_
         self._aggregator = OhlcvAggregator(
             symbol=self._symbol,
@@ -44,9 +49,18 @@ class MarketDataManager:
         )
         self._history_limit = history_limit
         self._lock = threading.RLock()
-        self._cache: dict[Timeframe, list[OhlcvCandle]] = {tf: [] for tf in self._timeframes}
+        self._persist_lock = threading.Lock()
+        # Immutable per-timeframe views rebuilt on every sync, so readers can share them freely.
+        self._cache: dict[Timeframe, tuple[OhlcvCandle, ...]] = {tf: () for tf in self._timeframes}
         self._persist_path = Path(persist_path).expanduser() if persist_path else None
+        if self._persist_path is not None:
+            try:
+                self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                logger.exception("Unable to create market data state directory")
         self._scheduler: AppScheduler | None = None
+        # Set by tick ingestion; the scheduler hook (or ``flush``) writes the state out.
+        self._dirty = False
 
         self._load_persisted_state()
 
@@ -69,7 +83,7 @@ class MarketDataManager:
         """Register the refresh hook on the provided scheduler."""
 
         self._scheduler = scheduler
-        scheduler.register(self.refresh_higher_timeframes)
+        scheduler.register(self.refresh_higher_timeframes, blocking=True)
         logger.debug("Scheduler attached to market data manager for %s", self._symbol)
 
     def seed(self, timeframe: Timeframe, candles: Iterable[OhlcvCandle]) -> None:
@@ -78,7 +92,8 @@ class MarketDataManager:
         with self._lock:
             self._aggregator.seed(timeframe, candles)
             self._sync_cache_locked()
-            self._persist_state_locked()
+            self._dirty = True
+        self._persist_state()
 
     def seed_batch(self, payload: dict[Timeframe, Iterable[OhlcvCandle]]) -> None:
         """Seed multiple timeframes with historical candles."""
@@ -93,34 +108,42 @@ class MarketDataManager:
         with self._lock:
             self._aggregator.update(localized)
             self._sync_cache_locked()
-            self._persist_state_locked()
+            self._dirty = True
 
     def refresh_higher_timeframes(self) -> None:
-        """Refresh cached candles for higher timeframes via the scheduler hook."""
+        """Refresh cached candles and persist pending changes via the scheduler hook."""
 
         with self._lock:
             self._sync_cache_locked()
-            self._persist_state_locked()
+        self._persist_state()
+
+    def flush(self) -> None:
+        """Persist state changed by ingested ticks that has not been written yet."""
+
+        self._persist_state()
 
     def get_latest(self, timeframe: Timeframe) -> OhlcvCandle | None:
         """Return the latest candle for the requested timeframe."""
 
         with self._lock:
-            candles = self._cache.get(timeframe, [])
+            candles = self._cache.get(timeframe, ())
             return candles[-1] if candles else None
 
-    def get_slice(self, timeframe: Timeframe, *, limit: int | None = None) -> list[OhlcvCandle]:
-        """Return a list of recent candles for a timeframe ordered oldest to newest."""
+    def get_slice(
+        self, timeframe: Timeframe, *, limit: int | None = None
+    ) -> tuple[OhlcvCandle, ...]:
+        """Return recent candles for a timeframe ordered oldest to newest.
+
+        The full history is returned without copying since the cached tuple is immutable.
+        """
 
         with self._lock:
-            candles = self._cache.get(timeframe, [])
-            if not candles:
-                return []
+            candles = self._cache.get(timeframe, ())
             if limit is None or limit >= len(candles):
-                return list(candles)
+                return candles
             if limit <= 0:
-                return []
-            return list(candles[-limit:])
+                return ()
+            return candles[-limit:]
 
     def get_rolling_high(self, timeframe: Timeframe, window: int) -> float | None:
         """Return the rolling high over the provided candle window."""
@@ -129,10 +152,11 @@ class MarketDataManager:
             msg = "Window must be a positive integer"
             raise ValueError(msg)
 
-        candles = self.get_slice(timeframe, limit=window)
-        if not candles:
-            return None
-        return max(candle.high for candle in candles)
+        with self._lock:
+            candles = self._cache.get(timeframe)
+            if not candles:
+                return None
+            return max(map(_candle_high, candles[-window:]))
 
     def get_rolling_low(self, timeframe: Timeframe, window: int) -> float | None:
         """Return the rolling low over the provided candle window."""
@@ -141,20 +165,24 @@ class MarketDataManager:
             msg = "Window must be a positive integer"
             raise ValueError(msg)
 
-        candles = self.get_slice(timeframe, limit=window)
-        if not candles:
-            return None
-        return min(candle.low for candle in candles)
+        with self._lock:
+            candles = self._cache.get(timeframe)
+            if not candles:
+                return None
+            return min(map(_candle_low, candles[-window:]))
 
     def snapshot(self) -> dict[str, Any]:
-        """Return a serializable snapshot of the cached state."""
+        """Return a serializable snapshot of the cached state.
+
+        Candle dictionaries are shared with the internal cache and must not be mutated.
+        """
 
         with self._lock:
             return {
                 "symbol": self._symbol,
                 "timeframes": {
-                    timeframe.interval: [candle.as_dict() for candle in self._cache[timeframe]]
-                    for timeframe in self._timeframes
+                    interval: [candle.as_dict() for candle in self._cache[timeframe]]
+                    for timeframe, interval in self._interval_keys.items()
                 },
             }
 
@@ -163,36 +191,49 @@ class MarketDataManager:
             candles = self._aggregator.get_candles(timeframe)
             if len(candles) > self._history_limit:
                 candles = candles[-self._history_limit :]
-            self._cache[timeframe] = candles
+            self._cache[timeframe] = tuple(candles)
+
+    def _persist_state(self) -> None:
+        """Write pending state to disk.
+
+        Only the snapshot is taken under the state lock; serialization and file I/O happen under
+        a separate lock so readers and tick ingestion are never blocked on the disk.
+        """
 
-    def _persist_state_locked(self) -> None:
         if self._persist_path is None:
             return
 
-        snapshot = self.snapshot()
-        try:
-            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
-            temp_path = self._persist_path.with_suffix(".tmp")
-            temp_path.write_text(json.dumps(snapshot, ensure_ascii=False))
-            temp_path.replace(self._persist_path)
-        except OSError:
-            logger.exception("Failed to persist market data state for %s", self._symbol)
+        with self._persist_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = self.snapshot()
+                self._dirty = False
+
+            try:
+                temp_path = self._persist_path.with_suffix(".tmp")
+                temp_path.write_bytes(orjson.dumps(snapshot))
+                temp_path.replace(self._persist_path)
+            except OSError:
+                logger.exception("Failed to persist market data state for %s", self._symbol)
+                with self._lock:
+                    self._dirty = True
 
     def _load_persisted_state(self) -> None:
         if self._persist_path is None or not self._persist_path.exists():
             return
 
         try:
-            raw = self._persist_path.read_text()
-            payload = json.loads(raw)
-        except (OSError, json.JSONDecodeError):
+            raw = self._persist_path.read_bytes()
+            payload = orjson.loads(raw)
+        except (OSError, orjson.JSONDecodeError):
             logger.exception("Unable to load persisted market data state")
             return
 
         timeframe_payload = payload.get("timeframes", {})
         with self._lock:
-            for timeframe in self._timeframes:
-                entries = timeframe_payload.get(timeframe.interval, [])
+            for timeframe, interval in self._interval_keys.items():
+                entries = timeframe_payload.get(interval, [])
                 if not entries:
                     continue
                 candles = [self._deserialize_candle(entry, timeframe) for entry in entries]
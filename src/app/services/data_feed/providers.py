@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import sys
 from collections.abc import AsyncIterator, Callable
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from importlib.util import find_spec
 from typing import Protocol
 
 import httpx
+import orjson
 
 try:  # pragma: no cover - optional dependency at runtime
-    import websockets
-    from websockets.legacy.client import Connect, WebSocketClientProtocol
+    from websockets.legacy.client import Connect
 except ImportError as exc:  # pragma: no cover - handled during dependency resolution
     raise RuntimeError("websockets dependency is required for the data feed service") from exc
 
@@ -46,6 +49,8 @@ class BinanceDataProvider:
     BASE_REST_URL = "https://api.binance.com"
     BASE_WS_URL = "wss://stream.binance.com:9443/ws"
     MAX_BACKOFF_SECONDS = 30.0
+    WS_READ_LIMIT = 2**20
+    WS_MAX_QUEUE = 1024
 
     def __init__(
         self,
@@ -54,59 +59,75 @@ class BinanceDataProvider:
         ws_factory: WsFactory | None = None,
         rate_limiter: AsyncRateLimiter | None = None,
     ) -> None:
-        self._owns_http_client = http_client is None
-        self._http_client = http_client or httpx.AsyncClient(base_url=self.BASE_REST_URL, timeout=10.0)
-        self._ws_factory = ws_factory or websockets.connect
+        self._http_client = http_client
+        self._owns_http_client = False
+        self._ws_factory = ws_factory or partial(
+            Connect,
+            read_limit=self.WS_READ_LIMIT,
+            max_queue=self.WS_MAX_QUEUE,
+            compression=None,
+        )
         self._rate_limiter = rate_limiter or AsyncRateLimiter(max_calls=8, period=1.0)
 
     async def fetch_recent_candles(
         self, symbol: str, timeframe: Timeframe, limit: int
     ) -> list[OhlcvCandle]:
-        symbol = symbol.upper()
+        symbol = sys.intern(symbol.upper())
         params = {
             "symbol": symbol,
             "interval": timeframe.interval,
             "limit": limit,
         }
 
+        http_client = self._http_client
+        if http_client is None:
+            http_client = self._http_client = _shared_http_clients.acquire()
+            self._owns_http_client = True
+
         async with self._rate_limiter:
-            response = await self._http_client.get("/api/v3/klines", params=params)
+            response = await http_client.get("/api/v3/klines", params=params)
         response.raise_for_status()
 
-        payload = response.json()
-        candles: list[OhlcvCandle] = []
-        for entry in payload:
-            open_time = datetime.fromtimestamp(entry[0] / 1000, tz=timezone.utc).astimezone(
-                ARGENTINA_TIMEZONE
-            )
-            close_time = datetime.fromtimestamp(entry[6] / 1000, tz=timezone.utc).astimezone(
-                ARGENTINA_TIMEZONE
-            )
-            candle = OhlcvCandle(
+        payload = orjson.loads(response.content)
+        from_timestamp = datetime.fromtimestamp
+        local_timezone = ARGENTINA_TIMEZONE
+        return [
+            OhlcvCandle(
                 symbol=symbol,
                 timeframe=timeframe,
-                open_time=open_time,
-                close_time=close_time,
+                open_time=from_timestamp(entry[0] * 0.001, tz=local_timezone),
+                close_time=from_timestamp(entry[6] * 0.001, tz=local_timezone),
                 open=float(entry[1]),
                 high=float(entry[2]),
                 low=float(entry[3]),
                 close=float(entry[4]),
                 volume=float(entry[5]),
             )
-            candles.append(candle)
-        return candles
+            for entry in payload
+        ]
 
     async def stream_trades(self, symbol: str) -> AsyncIterator[TradeTick]:
-        stream_symbol = symbol.lower()
-        stream = f"{stream_symbol}@trade"
-        url = f"{self.BASE_WS_URL}/{stream}"
+        url = f"{self.BASE_WS_URL}/{symbol.lower()}@trade"
         backoff = 1.0
 
+        tick_symbol = sys.intern(symbol.upper())
+        loads = orjson.loads
+        from_timestamp = datetime.fromtimestamp
+        local_timezone = ARGENTINA_TIMEZONE
+
         while True:
             try:
                 async with self._ws_factory(url) as websocket:
-                    async for tick in self._consume_stream(symbol, websocket):
-                        yield tick
+                    async for message in websocket:
+                        # websockets reassembles fragments, so each message is a whole document.
+                        payload = loads(message)
+                        yield TradeTick(
+                            symbol=tick_symbol,
+                            price=float(payload["p"]),
+                            quantity=float(payload["q"]),
+                            timestamp=from_timestamp(payload["T"] * 0.001, tz=local_timezone),
+                        )
+                    # Reconnects reuse the URL; only a clean close resets the backoff.
                     backoff = 1.0
             except asyncio.CancelledError:
                 raise
@@ -115,40 +136,97 @@ class BinanceDataProvider:
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
 
-    async def _consume_stream(
-        self, symbol: str, websocket: WebSocketClientProtocol
-    ) -> AsyncIterator[TradeTick]:
-        async for message in websocket:
-            payload = json.loads(message)
-            tick = TradeTick(
-                symbol=symbol.upper(),
-                price=float(payload["p"]),
-                quantity=float(payload["q"]),
-                timestamp=datetime.fromtimestamp(payload["T"] / 1000, tz=timezone.utc).astimezone(
-                    ARGENTINA_TIMEZONE
-                ),
-            )
-            yield tick
-
     async def close(self) -> None:
-        if self._owns_http_client:
-            await self._http_client.aclose()
+        if self._owns_http_client and self._http_client is not None:
+            client = self._http_client
+            self._http_client = None
+            self._owns_http_client = False
+            await _shared_http_clients.release(client)
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=BinanceDataProvider.BASE_REST_URL,
+        timeout=10.0,
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+
+@dataclass(slots=True)
+class _SharedClientEntry:
+    client: httpx.AsyncClient
+    users: int = 0
+
+
+class _SharedHttpClients:
+    """Reference-counted REST clients shared by Binance providers, one per event loop."""
+
+    def __init__(self) -> None:
+        # Pooled connections are bound to the loop that opened them, so loops never share one.
+        self._entries: dict[asyncio.AbstractEventLoop, _SharedClientEntry] = {}
+
+    def acquire(self) -> httpx.AsyncClient:
+        """Return the running loop's client, taking a reference on it."""
+
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(loop)
+        if entry is None:
+            self._discard_closed_loops()
+            entry = self._entries[loop] = _SharedClientEntry(_create_http_client())
+        entry.users += 1
+        return entry.client
+
+    async def release(self, client: httpx.AsyncClient) -> None:
+        """Drop a reference, closing the client once its last provider lets go of it."""
+
+        loop = next((loop for loop, entry in self._entries.items() if entry.client is client), None)
+        if loop is None:
+            return
+        entry = self._entries[loop]
+        entry.users -= 1
+        if entry.users == 0:
+            del self._entries[loop]
+            await client.aclose()
+
+    def _discard_closed_loops(self) -> None:
+        # Whatever providers held these never closed them, and their loop can no longer do so.
+        for loop in [loop for loop in self._entries if loop.is_closed()]:
+            del self._entries[loop]
+
+
+_shared_http_clients = _SharedHttpClients()
+
+
+ProviderBuilder = Callable[[], DataProvider]
+
+
+# Provider builders keyed by normalized provider name.
+_PROVIDERS: dict[str, ProviderBuilder] = {"binance": BinanceDataProvider}
 
 
 class ProviderFactory:
     """Factory helper to instantiate configured providers."""
 
+    @staticmethod
+    def register(provider_name: str, builder: ProviderBuilder) -> None:
+        """Register (or replace) the builder used for a provider name."""
+
+        _PROVIDERS[provider_name.strip().lower()] = builder
+
     @staticmethod
     def create(provider_name: str) -> DataProvider:
         normalized = provider_name.strip().lower()
-        if normalized == "binance":
-            return BinanceDataProvider()
-        if normalized == "bybit":  # pragma: no cover - placeholder for future expansion
-            msg = "Bybit provider not yet implemented"
-            raise NotImplementedError(msg)
-
-        msg = f"Unsupported market data provider '{provider_name}'"
-        raise ValueError(msg)
+        try:
+            builder = _PROVIDERS[normalized]
+        except KeyError:
+            if normalized == "bybit":  # pragma: no cover - placeholder for future expansion
+                msg = "Bybit provider not yet implemented"
+                raise NotImplementedError(msg) from None
+
+            msg = f"Unsupported market data provider '{provider_name}'"
+            raise ValueError(msg) from None
+        return builder()
 
 
 __all__ = ["BinanceDataProvider", "DataProvider", "ProviderFactory"]
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from typing import Deque
+from contextlib import suppress
 
 
 class AsyncRateLimiter:
-    """Simple token bucket style rate limiter for async workflows."""
+    """Token bucket rate limiter for async workflows."""
 
     def __init__(self, max_calls: int, period: float) -> None:
         if max_calls <= 0:
@@ -18,29 +17,35 @@ class AsyncRateLimiter:
             msg = "period must be positive"
             raise ValueError(msg)
 
-        self._max_calls = max_calls
-        self._period = period
-        self._lock = asyncio.Lock()
-        self._timestamps: Deque[float] = deque()
+        self._capacity = float(max_calls)
+        self._rate = max_calls / period
+        self._tokens = self._capacity
+        self._last_refill: float | None = None
+        self._cond = asyncio.Condition()
 
     async def acquire(self) -> None:
         """Acquire permission to perform an action respecting the quota."""
 
         loop = asyncio.get_running_loop()
 
-        while True:
-            async with self._lock:
+        async with self._cond:
+            while True:
                 now = loop.time()
-                while self._timestamps and now - self._timestamps[0] >= self._period:
-                    self._timestamps.popleft()
-
-                if len(self._timestamps) < self._max_calls:
-                    self._timestamps.append(now)
+                if self._last_refill is not None:
+                    elapsed = now - self._last_refill
+                    self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                self._last_refill = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    # Wake the next waiter in case more tokens are available.
+                    self._cond.notify()
                     return
 
-                wait_time = self._period - (now - self._timestamps[0])
-
-            await asyncio.sleep(wait_time)
+                # Sleep until the next token refills, releasing the lock meanwhile.
+                wait_time = (1.0 - self._tokens) / self._rate
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._cond.wait(), timeout=wait_time)
 
     async def __aenter__(self) -> "AsyncRateLimiter":
         await self.acquire()
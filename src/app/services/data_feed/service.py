@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from collections import deque
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from contextlib import suppress
-from dataclasses import replace
 from datetime import timezone
+from itertools import islice
 from typing import Deque
 from zoneinfo import ZoneInfo
 
@@ -33,7 +34,7 @@ class DataFeedService:
         timezone_: ZoneInfo = ARGENTINA_TIMEZONE,
     ) -> None:
         self._provider = provider
-        self._symbol = symbol.upper()
+        self._symbol = sys.intern(symbol.upper())
         self._timeframes = tuple(timeframes)
         self._history_limit = history_limit
         self._tick_buffer_size = tick_buffer_size
@@ -46,8 +47,13 @@ class DataFeedService:
         self._recent_ticks: Deque[TradeTick] = deque(maxlen=tick_buffer_size)
         self._latest_tick: TradeTick | None = None
         self._task: asyncio.Task[None] | None = None
+        self._worker_task: asyncio.Task[None] | None = None
+        # Decouples the websocket reader from aggregation; the oldest tick is dropped when full.
+        self._queue: asyncio.Queue[TradeTick] = asyncio.Queue(maxsize=tick_buffer_size)
+        self._dropped_ticks = 0
         self._stop_event = asyncio.Event()
         self._lock = asyncio.Lock()
+        self._ready = False
 
     @property
     def symbol(self) -> str:
@@ -55,6 +61,18 @@ class DataFeedService:
 
         return self._symbol
 
+    @property
+    def ready(self) -> bool:
+        """Return whether history has been seeded and the stream is running."""
+
+        return self._ready
+
+    @property
+    def dropped_ticks(self) -> int:
+        """Return how many ticks were discarded because processing fell behind the stream."""
+
+        return self._dropped_ticks
+
     @classmethod
     def from_settings(
         cls,
@@ -90,34 +108,45 @@ class DataFeedService:
 
             await self._seed_history()
             self._stop_event = asyncio.Event()
+            self._queue = asyncio.Queue(maxsize=self._tick_buffer_size)
+            self._dropped_ticks = 0
+            self._worker_task = asyncio.create_task(self._process(), name="data-feed-worker")
             self._task = asyncio.create_task(self._run(), name="data-feed-runner")
+            self._ready = True
             logger.info("Data feed service started for %s", self._symbol)
 
     async def stop(self) -> None:
         """Stop the streaming task and release resources."""
 
         async with self._lock:
+            self._ready = False
             if not self._task:
                 await self._provider.close()
                 return
 
             self._stop_event.set()
-            self._task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._task
+            tasks = [task for task in (self._task, self._worker_task) if task is not None]
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with suppress(asyncio.CancelledError):
+                    await task
             self._task = None
+            self._worker_task = None
             await self._provider.close()
             logger.info("Data feed service stopped for %s", self._symbol)
 
     def snapshot(self, *, max_ticks: int | None = None) -> dict[str, object]:
         """Return a serializable snapshot of the current feed state."""
 
-        ticks = list(self._recent_ticks)
-        if max_ticks is not None:
-            if max_ticks <= 0:
-                ticks = []
-            else:
-                ticks = ticks[-max_ticks:]
+        recent_ticks = self._recent_ticks
+        ticks: Iterable[TradeTick]
+        if max_ticks is None:
+            ticks = recent_ticks
+        elif max_ticks <= 0:
+            ticks = ()
+        else:
+            ticks = list(islice(reversed(recent_ticks), max_ticks))[::-1]
 
         return {
             "symbol": self._symbol,
@@ -133,33 +162,78 @@ class DataFeedService:
         logger.debug("Seeding historical candles for %s", self._symbol)
         self._recent_ticks.clear()
         self._latest_tick = None
-        for timeframe in self._timeframes:
-            candles = await self._provider.fetch_recent_candles(
-                self._symbol, timeframe, self._history_limit
-            )
-            self._aggregator.seed(timeframe, candles)
+        try:
+            async with asyncio.TaskGroup() as group:
+                fetches = [
+                    group.create_task(
+                        self._provider.fetch_recent_candles(
+                            self._symbol, timeframe, self._history_limit
+                        )
+                    )
+                    for timeframe in self._timeframes
+                ]
+        except BaseExceptionGroup as exc:
+            raise exc.exceptions[0] from None
+        for timeframe, fetch in zip(self._timeframes, fetches, strict=True):
+            self._aggregator.seed(timeframe, fetch.result())
 
     async def _run(self) -> None:
         try:
             async for tick in self._provider.stream_trades(self._symbol):
                 if self._stop_event.is_set():
                     break
-                self._handle_tick(tick)
+                if self._queue.full():
+                    # Give the worker a chance to drain before dropping anything.
+                    await asyncio.sleep(0)
+                self._enqueue(tick)
         except asyncio.CancelledError:
             raise
         except Exception:  # noqa: BLE001 - surface error while keeping consistent state
             logger.exception("Data feed service experienced an error")
             raise
 
+    def _enqueue(self, tick: TradeTick) -> None:
+        queue = self._queue
+        if queue.full():
+            # Keep the reader moving so the exchange does not drop the connection.
+            queue.get_nowait()
+            self._dropped_ticks += 1
+            if self._dropped_ticks == 1:
+                logger.warning(
+                    "Tick processing is falling behind for %s; dropping oldest ticks", self._symbol
+                )
+        queue.put_nowait(tick)
+
+    async def _process(self) -> None:
+        queue = self._queue
+        get_nowait = queue.get_nowait
+        handle_tick = self._handle_tick
+        while True:
+            tick = await queue.get()
+            while True:
+                try:
+                    handle_tick(tick)
+                except Exception:  # noqa: BLE001 - a bad tick must not stop aggregation
+                    logger.exception("Failed to process trade tick for %s", self._symbol)
+                if queue.empty():
+                    break
+                tick = get_nowait()
+
     def _handle_tick(self, tick: TradeTick) -> None:
         timestamp = tick.timestamp
-        if timestamp.tzinfo is None:
-            timestamp = timestamp.replace(tzinfo=timezone.utc)
-        localized = timestamp.astimezone(self._aggregator.timezone)
-        localized_tick = replace(tick, timestamp=localized)
-        self._latest_tick = localized_tick
-        self._recent_ticks.append(localized_tick)
-        self._aggregator.update(localized_tick)
+        target_timezone = self._aggregator.timezone
+        if timestamp.tzinfo is not target_timezone:
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            tick = TradeTick(
+                symbol=tick.symbol,
+                price=tick.price,
+                quantity=tick.quantity,
+                timestamp=timestamp.astimezone(target_timezone),
+            )
+        self._latest_tick = tick
+        self._recent_ticks.append(tick)
+        self._aggregator.update(tick)
 
 
 __all__ = ["DataFeedService"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from zoneinfo import ZoneInfo
@@ -20,17 +20,13 @@ class Timeframe(Enum):
     HOUR_4 = ("4h", timedelta(hours=4))
     DAY_1 = ("1d", timedelta(days=1))
 
-    @property
-    def interval(self) -> str:
-        """Return the exchange interval label."""
+    # Exchange interval label and frame length.
+    interval: str
+    duration: timedelta
 
-        return self.value[0]
-
-    @property
-    def duration(self) -> timedelta:
-        """Return the duration of the timeframe."""
-
-        return self.value[1]
+    def __init__(self, interval: str, duration: timedelta) -> None:
+        self.interval = interval
+        self.duration = duration
 
     @classmethod
     def default_sequence(cls) -> tuple["Timeframe", ...]:
@@ -54,16 +50,25 @@ class TradeTick:
     price: float
     quantity: float
     timestamp: datetime
+    _cached_dict: dict[str, object] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def as_dict(self) -> dict[str, object]:
-        """Serialize the tick into a JSON-friendly structure."""
+        """Serialize the tick into a JSON-friendly structure.
+
+        Ticks are never mutated, so the result is built once and reused; treat it as read-only.
+        """
 
-        return {
-            "symbol": self.symbol,
-            "price": self.price,
-            "quantity": self.quantity,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._cached_dict = {
+                "symbol": self.symbol,
+                "price": self.price,
+                "quantity": self.quantity,
+                "timestamp": self.timestamp.isoformat(),
+            }
+        return cached
 
 
 @dataclass(slots=True)
@@ -79,21 +84,36 @@ class OhlcvCandle:
     low: float
     close: float
     volume: float
+    _cached_dict: dict[str, object] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def as_dict(self) -> dict[str, object]:
-        """Serialize the candle into a JSON-friendly structure."""
-
-        return {
-            "symbol": self.symbol,
-            "timeframe": self.timeframe.interval,
-            "open_time": self.open_time.isoformat(),
-            "close_time": self.close_time.isoformat(),
-            "open": self.open,
-            "high": self.high,
-            "low": self.low,
-            "close": self.close,
-            "volume": self.volume,
-        }
+        """Serialize the candle into a JSON-friendly structure.
+
+        The result is cached and must be treated as read-only; call ``invalidate`` after
+        updating a candle in place.
+        """
+
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._cached_dict = {
+                "symbol": self.symbol,
+                "timeframe": self.timeframe.interval,
+                "open_time": self.open_time.isoformat(),
+                "close_time": self.close_time.isoformat(),
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            }
+        return cached
+
+    def invalidate(self) -> None:
+        """Discard the cached ``as_dict`` result after an in-place update."""
+
+        self._cached_dict = None
 
 
 __all__ = ["ARGENTINA_TIMEZONE", "OhlcvCandle", "Timeframe", "TradeTick"]
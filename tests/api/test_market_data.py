@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import get_settings
+from app.services.data_feed.service import DataFeedService
+from app.services.data_feed.types import OhlcvCandle, Timeframe
+
+
+class GatedProvider:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.release = threading.Event()
+        self.fail = fail
+        self.closed = False
+
+    async def fetch_recent_candles(
+        self, symbol: str, timeframe: Timeframe, limit: int
+    ) -> list[OhlcvCandle]:
+        if self.fail:
+            raise RuntimeError("exchange unavailable")
+        while not self.release.is_set():
+            await asyncio.sleep(0.01)
+        return []
+
+    async def stream_trades(self, symbol: str):  # noqa: ANN201 - async generator
+        await asyncio.sleep(3600)
+        yield  # pragma: no cover - never reached
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def install_provider(monkeypatch: pytest.MonkeyPatch, provider: GatedProvider) -> None:
+    settings = replace(get_settings(), market_data_enabled=True, market_data_symbol="BTCUSDT")
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+
+    def from_settings(provider_name: str, **kwargs: object) -> DataFeedService:
+        return DataFeedService(
+            provider=provider,
+            symbol=str(kwargs["symbol"]),
+            timeframes=[Timeframe.MINUTE_1],
+            history_limit=10,
+            tick_buffer_size=10,
+        )
+
+    monkeypatch.setattr(DataFeedService, "from_settings", staticmethod(from_settings))
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_market_data_reports_starting_until_feed_is_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = GatedProvider()
+    install_provider(monkeypatch, provider)
+
+    with TestClient(main.app) as client:
+        assert client.get("/api/health").status_code == 200
+
+        response = client.get("/api/market-data/BTCUSDT")
+        assert response.status_code == 503
+        assert response.json()["detail"] == "Market data feed is starting"
+
+        provider.release.set()
+        wait_until(lambda: client.get("/api/market-data/btcusdt").status_code == 200)
+        assert client.get("/api/market-data/BTCUSDT").json()["symbol"] == "BTCUSDT"
+        assert client.get("/api/market-data/ETHUSDT").status_code == 404
+
+    assert provider.closed is True
+
+
+def test_market_data_feed_is_withdrawn_when_startup_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    provider = GatedProvider(fail=True)
+    install_provider(monkeypatch, provider)
+
+    with TestClient(main.app) as client:
+        wait_until(lambda: client.app.state.data_feed_service is None)
+        assert provider.closed is True
+
+        response = client.get("/api/market-data/BTCUSDT")
+        assert response.status_code == 503
+        assert response.json()["detail"] == "Market data feed is not available"
+
+
+def test_pending_feed_startup_is_cancelled_on_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = GatedProvider()
+    install_provider(monkeypatch, provider)
+
+    with TestClient(main.app) as client:
+        assert client.get("/api/market-data/BTCUSDT").status_code == 503
+
+    assert provider.closed is True
+    assert client.app.state.data_feed_service.ready is False
+
+
+__all__ = [
+    "test_market_data_feed_is_withdrawn_when_startup_fails",
+    "test_market_data_reports_starting_until_feed_is_ready",
+    "test_pending_feed_startup_is_cancelled_on_shutdown",
+]
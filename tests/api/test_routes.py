@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.api.routes import build_health_template, healthcheck
+from app.core.config import get_settings
+
+HEALTH_KEYS = {
+    "status",
+    "application",
+    "version",
+    "environment",
+    "timezone",
+    "timestamp_eastern",
+    "timestamp_utc_minus_three",
+}
+
+
+def test_healthcheck_returns_full_payload_without_touching_template(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = replace(get_settings(), market_data_enabled=False)
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+
+    with TestClient(main.app) as client:
+        template = client.app.state.health_template
+        first = client.get("/api/health")
+        second = client.get("/api/health")
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        for payload in (first.json(), second.json()):
+            assert set(payload) == HEALTH_KEYS
+            assert payload["status"] == "ok"
+            assert payload["application"] == settings.app_name
+            assert payload["version"] == settings.app_version
+            assert payload["environment"] == settings.environment
+            assert payload["timezone"] == settings.default_timezone
+            eastern = datetime.fromisoformat(payload["timestamp_eastern"])
+            utc_minus_three = datetime.fromisoformat(payload["timestamp_utc_minus_three"])
+            assert eastern == utc_minus_three
+            assert utc_minus_three.utcoffset().total_seconds() == -3 * 3600
+
+        assert client.app.state.health_template is template
+        assert template == build_health_template(settings)
+
+
+@pytest.mark.asyncio
+async def test_healthcheck_returns_a_fresh_payload_per_call() -> None:
+    template = build_health_template(get_settings())
+    original = dict(template)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(health_template=template)))
+
+    first = await healthcheck(request)  # type: ignore[arg-type]
+    second = await healthcheck(request)  # type: ignore[arg-type]
+
+    assert first is not template
+    assert second is not template
+    assert first is not second
+    assert template == original
+
+
+__all__ = [
+    "test_healthcheck_returns_a_fresh_payload_per_call",
+    "test_healthcheck_returns_full_payload_without_touching_template",
+]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.core.event_loop import configure_event_loop
+
+
+@pytest.fixture
+def installed_policies(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    policies: list[object] = []
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", policies.append)
+    monkeypatch.setattr(sys, "platform", "linux")
+    return policies
+
+
+def test_configure_event_loop_installs_uvloop_policy(
+    monkeypatch: pytest.MonkeyPatch, installed_policies: list[object]
+) -> None:
+    class EventLoopPolicy:
+        pass
+
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.EventLoopPolicy = EventLoopPolicy  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+    assert configure_event_loop(" UVLOOP ") == "uvloop"
+    assert len(installed_policies) == 1
+    assert isinstance(installed_policies[0], EventLoopPolicy)
+
+
+def test_configure_event_loop_allows_opting_out(installed_policies: list[object]) -> None:
+    assert configure_event_loop("asyncio") == "asyncio"
+    assert installed_policies == []
+
+
+def test_configure_event_loop_falls_back_without_uvloop(
+    monkeypatch: pytest.MonkeyPatch, installed_policies: list[object]
+) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert configure_event_loop("uvloop") == "asyncio"
+    assert installed_policies == []
+
+
+def test_configure_event_loop_falls_back_on_windows(
+    monkeypatch: pytest.MonkeyPatch, installed_policies: list[object]
+) -> None:
+    monkeypatch.setattr(sys, "platform", "win32")
+
+    assert configure_event_loop("uvloop") == "asyncio"
+    assert installed_policies == []
+
+
+def test_unsupported_event_loops_are_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    with pytest.raises(ValueError):
+        configure_event_loop("trio")
+
+    monkeypatch.setenv("APP_EVENT_LOOP", "trio")
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+__all__ = [
+    "test_configure_event_loop_allows_opting_out",
+    "test_configure_event_loop_falls_back_on_windows",
+    "test_configure_event_loop_falls_back_without_uvloop",
+    "test_configure_event_loop_installs_uvloop_policy",
+    "test_unsupported_event_loops_are_rejected",
+]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.scheduler import AppScheduler
+
+
+class AwaitableReturningCallback:
+    def __init__(self) -> None:
+        self.awaited = False
+
+    def __call__(self) -> asyncio.Future[None]:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _: setattr(self, "awaited", True))
+        future.set_result(None)
+        return future
+
+
+@pytest.mark.asyncio
+async def test_scheduler_executes_sync_and_async_callbacks() -> None:
+    scheduler = AppScheduler(interval_seconds=1)
+    calls: list[str] = []
+
+    def sync_callback() -> None:
+        calls.append("sync")
+
+    async def async_callback() -> None:
+        await asyncio.sleep(0)
+        calls.append("async")
+
+    def failing_callback() -> None:
+        raise RuntimeError("boom")
+
+    awaitable_callback = AwaitableReturningCallback()
+
+    scheduler.register(sync_callback)
+    scheduler.register(failing_callback)
+    scheduler.register(async_callback)
+    scheduler.register(awaitable_callback)
+
+    await scheduler._execute_callbacks()  # type: ignore[attr-defined]
+
+    assert calls == ["sync", "async"]
+    await asyncio.sleep(0)
+    assert awaitable_callback.awaited is True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_on_interval_and_shuts_down_promptly() -> None:
+    scheduler = AppScheduler(interval_seconds=0.01)  # type: ignore[arg-type]
+    ticks: list[int] = []
+    scheduler.register(lambda: ticks.append(1))
+
+    await scheduler.start()
+    await asyncio.sleep(0.05)
+    assert ticks
+
+    scheduler.interval_seconds = 60
+    await asyncio.sleep(0.02)
+    await asyncio.wait_for(scheduler.shutdown(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_offloads_blocking_callbacks_to_threads() -> None:
+    scheduler = AppScheduler(interval_seconds=1)
+    threads: dict[str, int] = {}
+
+    scheduler.register(lambda: threads.setdefault("inline", threading.get_ident()))
+    scheduler.register(lambda: threads.setdefault("blocking", threading.get_ident()), blocking=True)
+
+    await scheduler._execute_callbacks()  # type: ignore[attr-defined]
+
+    assert threads["inline"] == threading.get_ident()
+    assert threads["blocking"] != threading.get_ident()
+
+    async def async_callback() -> None:
+        return None
+
+    with pytest.raises(ValueError):
+        scheduler.register(async_callback, blocking=True)
+
+
+__all__ = [
+    "test_scheduler_executes_sync_and_async_callbacks",
+    "test_scheduler_offloads_blocking_callbacks_to_threads",
+    "test_scheduler_runs_on_interval_and_shuts_down_promptly",
+]
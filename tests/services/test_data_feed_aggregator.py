@@ -54,4 +54,22 @@ def test_aggregator_updates_candles_across_timeframes() -> None:
     assert combined_candle.open_time.tzinfo.key == ARGENTINA_TIMEZONE.key
 
 
-__all__ = ["test_aggregator_updates_candles_across_timeframes"]
+def test_aggregator_refreshes_serialized_candle_after_update() -> None:
+    aggregator = OhlcvAggregator(symbol="BTCUSDT", timeframes=[Timeframe.MINUTE_1], max_length=10)
+
+    aggregator.update(make_tick(100.0, 0.25, hour=15, minute=0))
+    candle = aggregator.get_candles(Timeframe.MINUTE_1)[0]
+    assert candle.as_dict() is candle.as_dict()
+    assert candle.as_dict()["close"] == 100.0
+
+    aggregator.update(make_tick(103.0, 0.10, hour=15, minute=0, second=30))
+    serialized = candle.as_dict()
+    assert serialized["close"] == 103.0
+    assert serialized["high"] == 103.0
+    assert serialized["volume"] == pytest.approx(0.35)
+
+
+__all__ = [
+    "test_aggregator_refreshes_serialized_candle_after_update",
+    "test_aggregator_updates_candles_across_timeframes",
+]
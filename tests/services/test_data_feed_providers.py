@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 
+import httpx
 import pytest
 
-from app.services.data_feed.providers import BinanceDataProvider
+from app.services.data_feed import providers
+from app.services.data_feed.providers import BinanceDataProvider, ProviderFactory
 from app.services.data_feed.types import ARGENTINA_TIMEZONE, Timeframe
 
 
@@ -15,6 +18,10 @@ class StubResponse:
     def raise_for_status(self) -> None:
         return None
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
     def json(self) -> list[list[object]]:
         return self._payload
 
@@ -91,6 +98,89 @@ async def test_binance_fetch_recent_candles_respects_timezone() -> None:
     assert client.closed is False
 
 
+KLINES_PAYLOAD = [[1_720_000_000_000, "1", "2", "0.5", "1.5", "3", 1_720_000_060_000]]
+
+
+@pytest.fixture
+def shared_clients(monkeypatch: pytest.MonkeyPatch) -> list[httpx.AsyncClient]:
+    created: list[httpx.AsyncClient] = []
+
+    def create_client() -> httpx.AsyncClient:
+        client = httpx.AsyncClient(
+            base_url=BinanceDataProvider.BASE_REST_URL,
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, json=KLINES_PAYLOAD)),
+        )
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(providers, "_create_http_client", create_client)
+    monkeypatch.setattr(providers, "_shared_http_clients", providers._SharedHttpClients())
+    return created
+
+
+@pytest.mark.asyncio
+async def test_binance_injected_client_bypasses_shared_client(
+    shared_clients: list[httpx.AsyncClient],
+) -> None:
+    client = StubAsyncClient(KLINES_PAYLOAD)
+    provider = BinanceDataProvider(http_client=client)
+
+    await provider.fetch_recent_candles("BTCUSDT", Timeframe.MINUTE_1, limit=1)
+    await provider.close()
+
+    assert client.calls
+    assert client.closed is False
+    assert shared_clients == []
+
+
+def test_binance_shared_client_is_closed_by_its_last_provider_on_each_loop(
+    shared_clients: list[httpx.AsyncClient],
+) -> None:
+    async def fetch_with_two_providers() -> None:
+        created_before = len(shared_clients)
+        first, second = BinanceDataProvider(), BinanceDataProvider()
+        await first.fetch_recent_candles("BTCUSDT", Timeframe.MINUTE_1, limit=1)
+        await second.fetch_recent_candles("BTCUSDT", Timeframe.MINUTE_1, limit=1)
+        assert len(shared_clients) == created_before + 1
+
+        await first.close()
+        assert not shared_clients[-1].is_closed
+        await second.close()
+        assert shared_clients[-1].is_closed
+
+    # Each ``asyncio.run`` uses a fresh event loop, which must get a fresh client.
+    asyncio.run(fetch_with_two_providers())
+    asyncio.run(fetch_with_two_providers())
+
+    assert len(shared_clients) == 2
+    assert all(client.is_closed for client in shared_clients)
+
+
+def test_binance_shared_clients_are_tracked_per_event_loop(
+    shared_clients: list[httpx.AsyncClient],
+) -> None:
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first, second = BinanceDataProvider(), BinanceDataProvider()
+        first_loop.run_until_complete(
+            first.fetch_recent_candles("BTCUSDT", Timeframe.MINUTE_1, limit=1)
+        )
+        second_loop.run_until_complete(
+            second.fetch_recent_candles("BTCUSDT", Timeframe.MINUTE_1, limit=1)
+        )
+        first_client, second_client = shared_clients
+
+        second_loop.run_until_complete(second.close())
+        assert second_client.is_closed
+        assert not first_client.is_closed
+
+        first_loop.run_until_complete(first.close())
+        assert first_client.is_closed
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
 @pytest.mark.asyncio
 async def test_binance_stream_trades_yields_ticks() -> None:
     message = json.dumps({"p": "55000.12", "q": "0.010", "T": 1_720_000_060_000})
@@ -109,7 +199,28 @@ async def test_binance_stream_trades_yields_ticks() -> None:
     await provider.close()
 
 
+def test_provider_factory_creates_registered_providers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(providers, "_PROVIDERS", dict(providers._PROVIDERS))
+    custom = BinanceDataProvider(http_client=StubAsyncClient([]))
+
+    ProviderFactory.register(" Custom ", lambda: custom)
+
+    assert ProviderFactory.create("custom") is custom
+    assert ProviderFactory.create(" CUSTOM ") is custom
+    assert isinstance(ProviderFactory.create(" Binance "), BinanceDataProvider)
+
+
+def test_provider_factory_rejects_unknown_providers() -> None:
+    with pytest.raises(ValueError, match="Unsupported market data provider 'kraken'"):
+        ProviderFactory.create("kraken")
+
+
 __all__ = [
     "test_binance_fetch_recent_candles_respects_timezone",
+    "test_binance_injected_client_bypasses_shared_client",
+    "test_binance_shared_client_is_closed_by_its_last_provider_on_each_loop",
+    "test_binance_shared_clients_are_tracked_per_event_loop",
     "test_binance_stream_trades_yields_ticks",
+    "test_provider_factory_creates_registered_providers",
+    "test_provider_factory_rejects_unknown_providers",
 ]
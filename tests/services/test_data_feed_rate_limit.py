@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.data_feed.rate_limit import AsyncRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_concurrent_callers() -> None:
+    limiter = AsyncRateLimiter(max_calls=2, period=0.1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    completed: list[float] = []
+
+    async def call() -> None:
+        async with limiter:
+            completed.append(loop.time() - started)
+
+    await asyncio.wait_for(asyncio.gather(*(call() for _ in range(6))), timeout=2.0)
+
+    assert len(completed) == 6
+    assert completed[1] < 0.05
+    assert completed[-1] >= 0.18
+
+
+def test_rate_limiter_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(max_calls=0, period=1.0)
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(max_calls=1, period=0)
+
+
+__all__ = [
+    "test_rate_limiter_paces_concurrent_callers",
+    "test_rate_limiter_rejects_invalid_configuration",
+]
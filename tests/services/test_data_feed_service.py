@@ -98,4 +98,150 @@ async def test_data_feed_service_exposes_snapshot() -> None:
     assert provider.closed is True
 
 
-__all__ = ["test_data_feed_service_exposes_snapshot"]
+@pytest.mark.asyncio
+async def test_data_feed_service_drops_oldest_ticks_when_queue_is_full() -> None:
+    service = DataFeedService(
+        provider=MockProvider(candles_by_timeframe={}, ticks=[]),
+        symbol="BTCUSDT",
+        timeframes=[Timeframe.MINUTE_1],
+        history_limit=10,
+        tick_buffer_size=2,
+    )
+
+    for price in (100.0, 101.0, 102.0):
+        service._enqueue(  # type: ignore[attr-defined]
+            TradeTick(
+                symbol="BTCUSDT",
+                price=price,
+                quantity=0.1,
+                timestamp=datetime(2024, 1, 1, 12, 0, tzinfo=ARGENTINA_TIMEZONE),
+            )
+        )
+
+    assert service.dropped_ticks == 1
+    queued = [service._queue.get_nowait().price for _ in range(2)]  # type: ignore[attr-defined]
+    assert queued == [101.0, 102.0]
+
+
+@pytest.mark.asyncio
+async def test_data_feed_service_lets_the_worker_drain_before_dropping_ticks() -> None:
+    ticks = [
+        TradeTick(
+            symbol="BTCUSDT",
+            price=100.0 + offset,
+            quantity=0.1,
+            timestamp=datetime(2024, 1, 1, 12, 0, offset, tzinfo=ARGENTINA_TIMEZONE),
+        )
+        for offset in range(6)
+    ]
+    service = DataFeedService(
+        provider=MockProvider(candles_by_timeframe={}, ticks=ticks),
+        symbol="BTCUSDT",
+        timeframes=[Timeframe.MINUTE_1],
+        history_limit=10,
+        tick_buffer_size=2,
+    )
+
+    await service.start()
+    await asyncio.sleep(0.05)
+    await service.stop()
+
+    assert service.dropped_ticks == 0
+    assert service.snapshot()["latest_tick"]["price"] == pytest.approx(105.0)
+
+def test_data_feed_service_restarts_with_a_fresh_queue_on_a_new_loop() -> None:
+    open_time = datetime(2024, 1, 1, 12, 5, tzinfo=ARGENTINA_TIMEZONE)
+    seed_candle = OhlcvCandle(
+        symbol="BTCUSDT",
+        timeframe=Timeframe.MINUTE_1,
+        open_time=open_time,
+        close_time=open_time + Timeframe.MINUTE_1.duration,
+        open=100.0,
+        high=100.0,
+        low=100.0,
+        close=100.0,
+        volume=1.0,
+    )
+    live_tick = TradeTick(
+        symbol="BTCUSDT",
+        price=105.0,
+        quantity=0.5,
+        timestamp=datetime(2024, 1, 1, 12, 5, 30, tzinfo=ARGENTINA_TIMEZONE),
+    )
+    service = DataFeedService(
+        provider=MockProvider({Timeframe.MINUTE_1: [seed_candle]}, ticks=[live_tick]),
+        symbol="BTCUSDT",
+        timeframes=[Timeframe.MINUTE_1],
+        history_limit=10,
+        tick_buffer_size=1,
+    )
+
+    async def run_once() -> None:
+        await service.start()
+        await asyncio.sleep(0.05)
+        await service.stop()
+
+    asyncio.run(run_once())
+    for price in (90.0, 91.0):
+        service._enqueue(  # type: ignore[attr-defined]
+            TradeTick(
+                symbol="BTCUSDT",
+                price=price,
+                quantity=0.1,
+                timestamp=datetime(2024, 1, 1, 12, 0, tzinfo=ARGENTINA_TIMEZONE),
+            )
+        )
+    assert service.dropped_ticks == 1
+
+    asyncio.run(run_once())
+
+    assert service.dropped_ticks == 0
+    snapshot = service.snapshot()
+    assert [tick["price"] for tick in snapshot["recent_ticks"]] == [105.0]
+    candles = snapshot["ohlcv"]["1m"]
+    assert [candle["open_time"] for candle in candles] == [open_time.isoformat()]
+    assert candles[-1]["close"] == pytest.approx(105.0)
+
+class FailingSeedProvider(MockProvider):
+    def __init__(self) -> None:
+        super().__init__(candles_by_timeframe={}, ticks=[])
+        self.cancelled: list[Timeframe] = []
+
+    async def fetch_recent_candles(
+        self, symbol: str, timeframe: Timeframe, limit: int
+    ) -> list[OhlcvCandle]:
+        if timeframe is Timeframe.MINUTE_1:
+            raise RuntimeError("exchange unavailable")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled.append(timeframe)
+            raise
+        return []
+
+
+@pytest.mark.asyncio
+async def test_data_feed_service_cancels_pending_seeds_when_one_fails() -> None:
+    provider = FailingSeedProvider()
+    service = DataFeedService(
+        provider=provider,
+        symbol="BTCUSDT",
+        timeframes=[Timeframe.MINUTE_1, Timeframe.HOUR_1, Timeframe.DAY_1],
+        history_limit=10,
+        tick_buffer_size=5,
+    )
+
+    with pytest.raises(RuntimeError, match="exchange unavailable"):
+        await asyncio.wait_for(service.start(), timeout=1.0)
+
+    assert set(provider.cancelled) == {Timeframe.HOUR_1, Timeframe.DAY_1}
+    assert service.ready is False
+
+
+__all__ = [
+    "test_data_feed_service_cancels_pending_seeds_when_one_fails",
+    "test_data_feed_service_drops_oldest_ticks_when_queue_is_full",
+    "test_data_feed_service_exposes_snapshot",
+    "test_data_feed_service_lets_the_worker_drain_before_dropping_ticks",
+    "test_data_feed_service_restarts_with_a_fresh_queue_on_a_new_loop",
+]
@@ -18,9 +18,13 @@ def make_tick(price: float, quantity: float, hour: int, minute: int, second: int
 class RecordingScheduler:
     def __init__(self) -> None:
         self.callbacks: list[Callable[[], None]] = []
+        self.blocking: list[bool] = []
 
-    def register(self, callback: Callable[[], None]) -> None:  # pragma: no cover - simple helper
+    def register(
+        self, callback: Callable[[], None], *, blocking: bool = False
+    ) -> None:  # pragma: no cover - simple helper
         self.callbacks.append(callback)
+        self.blocking.append(blocking)
 
 
 def test_manager_ingests_ticks_and_exposes_slices() -> None:
@@ -112,14 +116,48 @@ def test_scheduler_refresh_rehydrates_cache(tmp_path: Path) -> None:
 
     assert scheduler.callbacks
     assert scheduler.callbacks[0].__self__ is manager
+    assert scheduler.blocking == [True]
 
     tick = make_tick(200.0, 0.5, hour=16, minute=5)
     manager.ingest_tick(tick)
 
-    manager._cache[Timeframe.MINUTE_1] = []  # type: ignore[attr-defined]
-    assert manager.get_slice(Timeframe.MINUTE_1) == []
+    manager._cache[Timeframe.MINUTE_1] = ()  # type: ignore[attr-defined]
+    assert manager.get_slice(Timeframe.MINUTE_1) == ()
 
     scheduler.callbacks[0]()
     refreshed = manager.get_slice(Timeframe.MINUTE_1)
     assert len(refreshed) == 1
     assert refreshed[0].open == pytest.approx(200.0)
+
+
+def test_tick_ingestion_defers_persistence_to_refresh(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    manager = MarketDataManager(
+        symbol="BTCUSDT",
+        timeframes=(Timeframe.MINUTE_1,),
+        history_limit=5,
+        persist_path=state_path,
+    )
+
+    manager.ingest_tick(make_tick(200.0, 0.5, hour=16, minute=5))
+    manager.ingest_tick(make_tick(201.0, 0.25, hour=16, minute=5, second=10))
+    assert not state_path.exists()
+
+    manager.refresh_higher_timeframes()
+    assert state_path.exists()
+    persisted = state_path.read_text()
+
+    manager.refresh_higher_timeframes()
+    assert state_path.read_text() == persisted
+
+    manager.ingest_tick(make_tick(202.0, 0.1, hour=16, minute=6))
+    manager.flush()
+    restored = MarketDataManager(
+        symbol="BTCUSDT",
+        timeframes=(Timeframe.MINUTE_1,),
+        history_limit=5,
+        persist_path=state_path,
+    )
+    latest = restored.get_latest(Timeframe.MINUTE_1)
+    assert latest is not None
+    assert latest.open == pytest.approx(202.0)